@@ -3,47 +3,92 @@ Configuration Manager - Centralized configuration handling
 Supports YAML configs, environment variables, and runtime overrides
 """
 
+import copy
 import os
-import yaml
-from typing import Any, Dict, Optional
+import json
+import tempfile
+import threading
+from functools import reduce
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
-from dotenv import load_dotenv
 from loguru import logger
 
 
+# Project-level .env file, resolved once at import
+_ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+# Marks a missing entry in lookup caches (None is a valid config value)
+_MISSING = object()
+
+
+def _flatten(data: Dict[str, Any], sep: str = '.', prefix: str = '') -> Dict[str, Any]:
+    """
+    Flatten a nested dict into fully-dotted keys.
+    
+    Intermediate keys are kept as well, so 'browser' maps to the section
+    dict and 'browser.type' maps to its value.
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in data.items():
+        dotted = f"{prefix}{sep}{key}" if prefix else str(key)
+        flat[dotted] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, sep, dotted))
+    return flat
+
+
 class ConfigManager:
     """
     Centralized configuration management with multiple sources.
     Priority: Runtime > Environment Variables > Config File > Defaults
     """
     
+    __slots__ = ('_initialized', '_config', '_flat', '_get_cache',
+                 '_env_overrides', '_env_key_cache', '_split_cache')
+    
     _instance = None
-    _config: Dict[str, Any] = {}
+    _lock = threading.Lock()
+    _env_loaded = False  # .env already looked up (found or not) in this process
     
     def __new__(cls):
-        """Singleton pattern to ensure single config instance."""
+        """
+        Thread-safe singleton (double-checked locking).
+        All initialization happens here, once; later calls just return the instance.
+        """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
+    def _initialize(self) -> None:
         """Initialize configuration manager."""
-        if self._initialized:
-            return
-            
-        self._initialized = True
+        self._config: Dict[str, Any] = {}
+        self._get_cache: Dict[str, Any] = {}
+        self._split_cache: Dict[str, Tuple[str, ...]] = {}
         self._load_env_variables()
+        # Environment overrides are snapshotted once; get() never calls getenv
+        self._env_overrides: Dict[str, str] = dict(os.environ)
+        self._env_key_cache: Dict[str, str] = {}
         self._load_config_file()
         self._set_defaults()
+        self._flat = _flatten(self._config)
+        self._initialized = True
         logger.info("Configuration Manager initialized")
         
     def _load_env_variables(self) -> None:
-        """Load environment variables from .env file."""
-        env_file = Path(__file__).parent.parent.parent / ".env"
-        if env_file.exists():
-            load_dotenv(env_file)
-            logger.info(f"Loaded environment variables from {env_file}")
+        """Load environment variables from .env file (looked up once per process)."""
+        if ConfigManager._env_loaded:
+            return
+        ConfigManager._env_loaded = True
+        
+        if _ENV_PATH.exists():
+            from dotenv import load_dotenv
+            load_dotenv(_ENV_PATH)
+            logger.info(f"Loaded environment variables from {_ENV_PATH}")
         else:
             logger.warning("No .env file found")
             
@@ -57,14 +102,56 @@ class ConfigManager:
         if not config_file.exists():
             logger.warning(f"Config file not found: {config_file}")
             return
-            
+        
+        # Parsed config is cached as JSON next to the YAML; reuse it while fresh
+        cache_file = config_file.with_suffix(".yml.cache.json")
+        try:
+            if cache_file.stat().st_mtime >= config_file.stat().st_mtime:
+                with open(cache_file, 'r') as f:
+                    self._config = json.load(f)
+                logger.info(f"Loaded configuration from cache {cache_file}")
+                return
+        except (OSError, ValueError):
+            pass
+        
+        # Only pay for importing PyYAML when the cache can't be used
+        import yaml
+        # libyaml-backed loader when available, pure-Python fallback otherwise
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        
         try:
             with open(config_file, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = yaml.load(f, Loader=loader) or {}
             logger.info(f"Loaded configuration from {config_file}")
         except Exception as e:
             logger.error(f"Error loading config file: {e}")
-            
+            return
+        
+        self._write_config_cache(cache_file)
+    
+    def _write_config_cache(self, cache_file: Path) -> None:
+        """
+        Atomically write the parsed config to its JSON cache file.
+        Skipped when JSON would change the config (non-str keys), so a warm
+        load always sees the same dict as a fresh YAML parse.
+        """
+        try:
+            payload = json.dumps(self._config)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Config not JSON-serializable, skipping cache: {e}")
+            return
+        if json.loads(payload) != self._config:
+            logger.debug("Config does not round-trip through JSON, skipping cache")
+            return
+        
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {cache_file}: {e}")
+    
     def _set_defaults(self) -> None:
         """Set default values for essential configurations."""
         defaults = {
@@ -79,7 +166,7 @@ class ConfigManager:
                 "env": "dev",
             },
             "selenium": {
-                "implicit_wait": 10,
+                "implicit_wait": 0,
                 "explicit_wait": 10,
                 "page_load_timeout": 30,
             },
@@ -103,16 +190,12 @@ class ConfigManager:
         
         # Merge defaults with loaded config (loaded config takes priority)
         for section, values in defaults.items():
-            if section not in self._config:
-                self._config[section] = values
-            else:
-                for key, value in values.items():
-                    if key not in self._config[section]:
-                        self._config[section][key] = value
+            self._config[section] = {**values, **(self._config.get(section) or {})}
                         
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
+        Resolved values are memoized until the next set()/update_section().
         
         Args:
             key: Configuration key (e.g., 'browser.type')
@@ -125,23 +208,23 @@ class ConfigManager:
             config.get('browser.type')  # Returns 'chrome'
             config.get('app.url')  # Returns app URL
         """
-        # Check environment variable first
-        env_key = key.upper().replace('.', '_')
-        env_value = os.getenv(env_key)
-        if env_value is not None:
-            return env_value
-            
-        # Navigate through nested dict
-        keys = key.split('.')
-        value = self._config
-        
-        try:
-            for k in keys:
-                value = value[k]
+        value = self._get_cache.get(key, _MISSING)
+        if value is not _MISSING:
             return value
-        except (KeyError, TypeError):
-            logger.debug(f"Config key not found: {key}, returning default: {default}")
-            return default
+            
+        # Check environment variable first ('browser.type' -> BROWSER_TYPE)
+        env_key = self._env_key_cache.get(key)
+        if env_key is None:
+            env_key = self._env_key_cache[key] = key.upper().replace('.', '_')
+        value = self._env_overrides.get(env_key, _MISSING)
+        if value is _MISSING:
+            value = self._flat.get(key, _MISSING)
+            if value is _MISSING:
+                logger.debug(f"Config key not found: {key}, returning default: {default}")
+                return default
+                
+        self._get_cache[key] = value
+        return value
             
     def set(self, key: str, value: Any) -> None:
         """
@@ -151,22 +234,23 @@ class ConfigManager:
             key: Configuration key (e.g., 'browser.type')
             value: Value to set
         """
-        keys = key.split('.')
-        config = self._config
-        
-        # Navigate to the last level
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        keys = self._split_cache.get(key)
+        if keys is None:
+            keys = self._split_cache[key] = tuple(key.split('.'))
             
+        # Navigate to the last level, creating sections as needed
+        config = reduce(lambda node, k: node.setdefault(k, {}), keys[:-1], self._config)
+        
         # Set the value
         config[keys[-1]] = value
+        self._reflatten(keys[0])
+        self._get_cache.clear()
         logger.debug(f"Set config: {key} = {value}")
         
     def get_section(self, section: str) -> Dict[str, Any]:
         """
         Get entire configuration section.
+        Returns a copy; use set()/update_section() to change values.
         
         Args:
             section: Section name (e.g., 'browser')
@@ -174,7 +258,7 @@ class ConfigManager:
         Returns:
             Dictionary of section configuration
         """
-        return self._config.get(section, {})
+        return copy.deepcopy(self._config.get(section, {}))
         
     def update_section(self, section: str, values: Dict[str, Any]) -> None:
         """
@@ -188,11 +272,20 @@ class ConfigManager:
             self._config[section] = {}
             
         self._config[section].update(values)
+        self._reflatten(section)
+        self._get_cache.clear()
         logger.debug(f"Updated section: {section}")
         
+    def _reflatten(self, section: str) -> None:
+        """Rebuild the flat lookup entries for a single top-level section."""
+        prefix = f"{section}."
+        for dotted in [k for k in self._flat if k == section or k.startswith(prefix)]:
+            del self._flat[dotted]
+        self._flat.update(_flatten({section: self._config[section]}))
+    
     def get_all(self) -> Dict[str, Any]:
-        """Get entire configuration."""
-        return self._config.copy()
+        """Get entire configuration (a copy; use set() to change values)."""
+        return copy.deepcopy(self._config)
         
     # ============= Convenience Methods =============
     
@@ -253,5 +346,9 @@ class ConfigManager:
         logger.info(json.dumps(self._config, indent=2))
 
 
-# Global instance
-config = ConfigManager()
+# Global instance, created on first access (PEP 562)
+def __getattr__(name: str) -> Any:
+    if name == "config":
+        globals()["config"] = ConfigManager()
+        return globals()["config"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
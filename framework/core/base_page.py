@@ -3,7 +3,8 @@ Base Page - Foundation for Page Object Model
 Provides reusable methods for all page objects
 """
 
-from typing import List, Optional, Tuple
+import re
+from typing import Dict, List, Optional, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,7 +17,68 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 from loguru import logger
-import time
+from framework.config import config_manager
+
+
+# Expected conditions bound once at import instead of looked up on EC per wait
+_visibility_of = EC.visibility_of_element_located
+_presence_of_all = EC.presence_of_all_elements_located
+_clickable = EC.element_to_be_clickable
+_invisibility_of = EC.invisibility_of_element_located
+_url_contains = EC.url_contains
+_ALERT_PRESENT = EC.alert_is_present()  # stateless, safe to share
+
+# Locator strategies get_many() can resolve inside the browser in one call
+_BATCH_STRATEGIES = frozenset({
+    By.ID, By.CSS_SELECTOR, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.XPATH
+})
+
+_FIND_MANY_JS = """
+return arguments[0].map(function (locator) {
+    var by = locator[0], value = locator[1];
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'css selector': return document.querySelector(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return null;
+});
+"""
+
+# Booleans only: no element handles to register and serialize
+_PRESENCE_JS = """
+return arguments[0].map(function (selector) {
+    return document.querySelector(selector) !== null;
+});
+"""
+
+_SCROLL_INTO_VIEW_JS = """
+var element = arguments[0], done = arguments[arguments.length - 1];
+element.scrollIntoView({behavior: 'instant', block: 'center'});
+requestAnimationFrame(function () {
+    requestAnimationFrame(function () { done(element.getBoundingClientRect().toJSON()); });
+});
+"""
+
+# Apply highlight, hold it, restore the original style - all in one call
+_HIGHLIGHT_JS = """
+var element = arguments[0], duration = arguments[1], done = arguments[arguments.length - 1];
+var original = element.getAttribute('style');
+element.setAttribute('style', 'border: 2px solid red; background: yellow;');
+setTimeout(function () {
+    if (original === null) { element.removeAttribute('style'); }
+    else { element.setAttribute('style', original); }
+    done();
+}, duration);
+"""
+
+# IDs usable as a bare '#id' selector; anything else needs [id="..."]
+_CSS_IDENT = re.compile(r"-?[A-Za-z_][\w-]*")
 
 
 class BasePage:
@@ -25,6 +87,8 @@ class BasePage:
     Implements robust waiting, error handling, and interaction methods.
     """
 
+    __slots__ = ('driver', 'timeout', 'wait', '_waits', '_element_cache')
+    
     def __init__(self, driver: WebDriver, timeout: int = 10):
         """
         Initialize Base Page.
@@ -36,28 +100,88 @@ class BasePage:
         self.driver = driver
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
+        self._waits: Dict[int, WebDriverWait] = {timeout: self.wait}
+        # Elements returned by wait_for_element, reused until stale or navigation
+        self._element_cache: Dict[Tuple[By, str], WebElement] = {}
+    
+    def _wait(self, timeout: Optional[int] = None) -> WebDriverWait:
+        """Return a reusable WebDriverWait for the given timeout."""
+        timeout = timeout or self.timeout
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
+        
+    # ============= Element Cache =============
+    
+    def _cached_element(self, locator: Tuple[By, str],
+                        clickable: bool = False) -> Optional[WebElement]:
+        """
+        Return the cached element for a locator if it is still usable.
+        Stale or hidden (or, for clickable lookups, disabled) entries are evicted.
+        """
+        element = self._element_cache.get(locator)
+        if element is None:
+            return None
         
+        try:
+            if element.is_displayed() and (not clickable or element.is_enabled()):
+                return element
+        except (StaleElementReferenceException, NoSuchElementException):
+            pass
+        del self._element_cache[locator]
+        return None
+    
+    def clear_element_cache(self) -> None:
+        """Forget all cached elements (e.g. after the page changed behind our back)."""
+        self._element_cache.clear()
+    
+    @staticmethod
+    def _css(locator: Tuple[By, str]) -> Optional[str]:
+        """
+        Translate a locator into an equivalent CSS selector.
+        
+        Returns:
+            CSS selector string, or None for XPath / link-text locators
+        """
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return value
+        if by == By.ID:
+            return f"#{value}" if _CSS_IDENT.fullmatch(value) else f'[id="{value}"]'
+        if by == By.NAME:
+            return f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return f".{value}"
+        if by == By.TAG_NAME:
+            return value
+        return None
+    
     # ============= Navigation Methods =============
     
     def navigate_to(self, url: str) -> None:
         """Navigate to specified URL."""
         logger.info(f"Navigating to: {url}")
         self.driver.get(url)
+        self._element_cache.clear()
         
     def refresh_page(self) -> None:
         """Refresh current page."""
         logger.info("Refreshing page")
         self.driver.refresh()
+        self._element_cache.clear()
         
     def go_back(self) -> None:
         """Navigate back in browser history."""
         logger.info("Navigating back")
         self.driver.back()
+        self._element_cache.clear()
         
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
         logger.info("Navigating forward")
         self.driver.forward()
+        self._element_cache.clear()
         
     # ============= Wait Methods =============
     
@@ -65,6 +189,7 @@ class BasePage:
                          timeout: Optional[int] = None) -> WebElement:
         """
         Wait for element to be present and visible.
+        An element found earlier on the same page is reused if still displayed.
         
         Args:
             locator: Tuple of (By, locator_string)
@@ -76,13 +201,18 @@ class BasePage:
         Raises:
             TimeoutException: If element not found within timeout
         """
+        cached = self._cached_element(locator)
+        if cached is not None:
+            return cached
+        
         timeout = timeout or self.timeout
         logger.debug(f"Waiting for element: {locator}")
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            element = self._wait(timeout).until(
+                _visibility_of(locator)
             )
+            self._element_cache[locator] = element
             return element
         except TimeoutException:
             logger.error(f"Element not found within {timeout}s: {locator}")
@@ -95,8 +225,8 @@ class BasePage:
         logger.debug(f"Waiting for elements: {locator}")
         
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located(locator)
+            elements = self._wait(timeout).until(
+                _presence_of_all(locator)
             )
             return elements
         except TimeoutException:
@@ -105,14 +235,19 @@ class BasePage:
             
     def wait_for_element_clickable(self, locator: Tuple[By, str],
                                    timeout: Optional[int] = None) -> WebElement:
-        """Wait for element to be clickable."""
+        """Wait for element to be clickable (cached elements are reused if enabled)."""
+        cached = self._cached_element(locator, clickable=True)
+        if cached is not None:
+            return cached
+        
         timeout = timeout or self.timeout
         logger.debug(f"Waiting for element to be clickable: {locator}")
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
+            element = self._wait(timeout).until(
+                _clickable(locator)
             )
+            self._element_cache[locator] = element
             return element
         except TimeoutException:
             logger.error(f"Element not clickable within {timeout}s: {locator}")
@@ -125,8 +260,8 @@ class BasePage:
         logger.debug(f"Waiting for element to be invisible: {locator}")
         
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
+            return self._wait(timeout).until(
+                _invisibility_of(locator)
             )
         except TimeoutException:
             logger.error(f"Element still visible after {timeout}s: {locator}")
@@ -139,8 +274,8 @@ class BasePage:
         logger.debug(f"Waiting for URL to contain: {text}")
         
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.url_contains(text)
+            return self._wait(timeout).until(
+                _url_contains(text)
             )
         except TimeoutException:
             logger.error(f"URL doesn't contain '{text}' after {timeout}s")
@@ -206,21 +341,77 @@ class BasePage:
         timeout = timeout or self.timeout
         
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            self._wait(timeout).until(
+                _visibility_of(locator)
             )
             return True
         except TimeoutException:
             return False
             
     def is_element_present(self, locator: Tuple[By, str]) -> bool:
-        """Check if element is present in DOM."""
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        """Check if element is present in DOM (returns immediately, never waits)."""
+        return bool(self.driver.find_elements(*locator))
             
+    # ============= Batch Lookup Methods =============
+    
+    def get_many(self, locators: Dict[str, Tuple[By, str]]) -> Dict[str, Optional[WebElement]]:
+        """
+        Resolve several locators with a single browser round-trip.
+        
+        ID, CSS, name, class name, tag name and XPath locators are resolved
+        together by one script; link-text locators fall back to find_elements.
+        
+        Args:
+            locators: Mapping of name -> (By, locator_string)
+        
+        Returns:
+            Mapping of name -> first matching WebElement (None if nothing matches)
+        """
+        batched = [name for name, (by, _) in locators.items() if by in _BATCH_STRATEGIES]
+        found: Dict[str, Optional[WebElement]] = {}
+        
+        if batched:
+            logger.debug(f"Resolving {len(batched)} locators in one call")
+            elements = self.driver.execute_script(
+                _FIND_MANY_JS, [list(locators[name]) for name in batched]
+            )
+            found.update(zip(batched, elements))
+        
+        for name, locator in locators.items():
+            if name not in found:
+                matches = self.driver.find_elements(*locator)
+                found[name] = matches[0] if matches else None
+        
+        return {name: found[name] for name in locators}
+    
+    def are_present(self, locators: Dict[str, Tuple[By, str]]) -> Dict[str, bool]:
+        """
+        Check presence of several locators with a single browser round-trip.
+        
+        Locators with a CSS equivalent are tested by one script that returns
+        booleans only; XPath and link-text locators use is_element_present().
+        
+        Args:
+            locators: Mapping of name -> (By, locator_string)
+        
+        Returns:
+            Mapping of name -> True if the element is in the DOM
+        """
+        selectors = {name: self._css(locator) for name, locator in locators.items()}
+        batched = [name for name, selector in selectors.items() if selector is not None]
+        present: Dict[str, bool] = {}
+        
+        if batched:
+            present.update(zip(batched, self.driver.execute_script(
+                _PRESENCE_JS, [selectors[name] for name in batched]
+            )))
+        
+        for name, locator in locators.items():
+            if name not in present:
+                present[name] = self.is_element_present(locator)
+        
+        return {name: present[name] for name in locators}
+    
     # ============= Advanced Interaction Methods =============
     
     def hover_over(self, locator: Tuple[By, str], 
@@ -261,13 +452,18 @@ class BasePage:
         actions.drag_and_drop(source_element, target_element).perform()
         
     def scroll_to_element(self, locator: Tuple[By, str],
-                         timeout: Optional[int] = None) -> None:
-        """Scroll element into view."""
+                         timeout: Optional[int] = None) -> Dict[str, float]:
+        """
+        Scroll element into view.
+        
+        Returns:
+            Element bounding rect after scrolling (x, y, width, height, top, ...)
+        """
         element = self.wait_for_element(locator, timeout)
         logger.info(f"Scrolling to element: {locator}")
         
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.3)  # Allow scroll animation
+        # Instant scroll, then let the browser finish a layout/paint cycle
+        return self.driver.execute_async_script(_SCROLL_INTO_VIEW_JS, element)
         
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page."""
@@ -288,22 +484,15 @@ class BasePage:
         
     def highlight_element(self, locator: Tuple[By, str],
                          timeout: Optional[int] = None) -> None:
-        """Highlight element (useful for debugging)."""
-        element = self.wait_for_element(locator, timeout)
-        original_style = element.get_attribute("style")
-        
-        # Apply highlight
-        self.driver.execute_script(
-            "arguments[0].setAttribute('style', 'border: 2px solid red; background: yellow;');",
-            element
-        )
-        time.sleep(0.5)
+        """
+        Highlight element (useful for debugging).
+        No-op unless 'debug.highlight' is enabled in config.
+        """
+        if not config_manager.config.get('debug.highlight', False):
+            return
         
-        # Restore original style
-        self.driver.execute_script(
-            f"arguments[0].setAttribute('style', '{original_style}');",
-            element
-        )
+        element = self.wait_for_element(locator, timeout)
+        self.driver.execute_async_script(_HIGHLIGHT_JS, element, 500)
         
     # ============= Utility Methods =============
     
@@ -321,16 +510,19 @@ class BasePage:
         frame = self.wait_for_element(locator, timeout)
         logger.info(f"Switching to frame: {locator}")
         self.driver.switch_to.frame(frame)
+        self._element_cache.clear()
         
     def switch_to_default_content(self) -> None:
         """Switch back to default content from iframe."""
         logger.info("Switching to default content")
         self.driver.switch_to.default_content()
+        self._element_cache.clear()
         
     def switch_to_window(self, window_handle: str) -> None:
         """Switch to window by handle."""
         logger.info(f"Switching to window: {window_handle}")
         self.driver.switch_to.window(window_handle)
+        self._element_cache.clear()
         
     def get_window_handles(self) -> List[str]:
         """Get all window handles."""
@@ -342,7 +534,7 @@ class BasePage:
         logger.info("Accepting alert")
         
         try:
-            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            self._wait(timeout).until(_ALERT_PRESENT)
             alert = self.driver.switch_to.alert
             alert.accept()
         except TimeoutException:
@@ -354,7 +546,7 @@ class BasePage:
         logger.info("Dismissing alert")
         
         try:
-            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            self._wait(timeout).until(_ALERT_PRESENT)
             alert = self.driver.switch_to.alert
             alert.dismiss()
         except TimeoutException:
@@ -365,7 +557,7 @@ class BasePage:
         timeout = timeout or self.timeout
         
         try:
-            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            self._wait(timeout).until(_ALERT_PRESENT)
             alert = self.driver.switch_to.alert
             return alert.text
         except TimeoutException:
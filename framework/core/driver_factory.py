@@ -3,7 +3,11 @@ Driver Factory - Centralized WebDriver Management
 Handles browser initialization, configuration, and cleanup
 """
 
-from typing import Optional
+import atexit
+import importlib
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -11,18 +15,60 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from loguru import logger
 
 
+# ============= Browser Option Templates =============
+# Built once at import; treat as read-only.
+
+_CHROME_ARGS = (
+    # Performance optimizations
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-infobars",
+    "--disable-notifications",
+    # Privacy & Security
+    "--incognito",
+)
+_CHROME_EXCLUDE_SWITCHES = ["enable-logging"]
+_CHROME_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False
+}
+_CHROME_HEADLESS_ARGS = ("--headless=new", "--window-size=1920,1080")
+
+_FIREFOX_PREFS = (
+    ("dom.webnotifications.enabled", False),
+    ("media.volume_scale", "0.0"),
+)
+_FIREFOX_HEADLESS_ARGS = ("--headless", "--width=1920", "--height=1080")
+
+_EDGE_ARGS = ("--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage")
+_EDGE_HEADLESS_ARGS = ("--headless=new", "--window-size=1920,1080")
+
+# webdriver-manager installers per local browser (imported on first use)
+_DRIVER_MANAGERS = {
+    "chrome": ("webdriver_manager.chrome", "ChromeDriverManager"),
+    "firefox": ("webdriver_manager.firefox", "GeckoDriverManager"),
+    "edge": ("webdriver_manager.microsoft", "EdgeChromiumDriverManager"),
+}
+
+
 class DriverFactory:
     """
     Factory class for creating and managing WebDriver instances.
     Supports Chrome, Firefox, Edge, and remote execution.
+    All drivers reuse one persistent HTTP connection (keep_alive=True) for
+    their WebDriver commands instead of reconnecting per command.
     """
 
+    # Driver binary paths resolved by webdriver-manager, shared process-wide
+    _driver_paths: Dict[str, str] = {}
+    _install_lock = threading.Lock()
+    
     def __init__(self, browser: str = "chrome", headless: bool = False, 
                  remote_url: Optional[str] = None):
         """
@@ -51,21 +97,21 @@ class DriverFactory:
         logger.info(f"Creating {self.browser} driver (headless={self.headless})")
         
         if self.remote_url:
-            return self._create_remote_driver()
-            
-        driver_map = {
-            "chrome": self._create_chrome_driver,
-            "firefox": self._create_firefox_driver,
-            "edge": self._create_edge_driver,
-        }
-        
-        if self.browser not in driver_map:
+            self.driver = self._create_remote_driver()
+        elif self.browser == "chrome":
+            self.driver = self._create_chrome_driver()
+        elif self.browser == "firefox":
+            self.driver = self._create_firefox_driver()
+        elif self.browser == "edge":
+            self.driver = self._create_edge_driver()
+        else:
             raise ValueError(
                 f"Unsupported browser: {self.browser}. "
-                f"Supported browsers: {', '.join(driver_map.keys())}"
+                f"Supported browsers: {', '.join(_DRIVER_MANAGERS)}"
             )
             
-        self.driver = driver_map[self.browser]()
+        if not self.remote_url:
+            self._pin_loopback(self.driver)
         self._configure_driver()
         return self.driver
     
@@ -73,61 +119,76 @@ class DriverFactory:
         """Create Chrome WebDriver with optimized options."""
         options = ChromeOptions()
         
-        # Performance optimizations
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-notifications")
-        
-        # Privacy & Security
-        options.add_argument("--incognito")
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-        options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.notifications": 2,
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False
-        })
+        for arg in _CHROME_ARGS:
+            options.add_argument(arg)
+        options.add_experimental_option("excludeSwitches", _CHROME_EXCLUDE_SWITCHES)
+        options.add_experimental_option("prefs", _CHROME_PREFS)
         
         if self.headless:
-            options.add_argument("--headless=new")
-            options.add_argument("--window-size=1920,1080")
+            for arg in _CHROME_HEADLESS_ARGS:
+                options.add_argument(arg)
             
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        service = ChromeService(self._driver_path("chrome"))
+        return webdriver.Chrome(service=service, options=options, keep_alive=True)
     
     def _create_firefox_driver(self) -> webdriver.Firefox:
         """Create Firefox WebDriver with optimized options."""
         options = FirefoxOptions()
         
-        # Performance optimizations
-        options.set_preference("dom.webnotifications.enabled", False)
-        options.set_preference("media.volume_scale", "0.0")
+        for name, value in _FIREFOX_PREFS:
+            options.set_preference(name, value)
         
         if self.headless:
-            options.add_argument("--headless")
-            options.add_argument("--width=1920")
-            options.add_argument("--height=1080")
+            for arg in _FIREFOX_HEADLESS_ARGS:
+                options.add_argument(arg)
             
-        service = FirefoxService(GeckoDriverManager().install())
-        return webdriver.Firefox(service=service, options=options)
+        service = FirefoxService(self._driver_path("firefox"))
+        return webdriver.Firefox(service=service, options=options, keep_alive=True)
     
     def _create_edge_driver(self) -> webdriver.Edge:
         """Create Edge WebDriver with optimized options."""
         options = EdgeOptions()
         
-        # Performance optimizations
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
+        for arg in _EDGE_ARGS:
+            options.add_argument(arg)
         
         if self.headless:
-            options.add_argument("--headless")
-            options.add_argument("--window-size=1920,1080")
+            for arg in _EDGE_HEADLESS_ARGS:
+                options.add_argument(arg)
             
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        return webdriver.Edge(service=service, options=options)
+        service = EdgeService(self._driver_path("edge"))
+        return webdriver.Edge(service=service, options=options, keep_alive=True)
+    
+    @classmethod
+    def _driver_path(cls, browser: str) -> str:
+        """Install/locate the driver binary once per process and reuse the path."""
+        path = cls._driver_paths.get(browser)
+        if path is None:
+            with cls._install_lock:
+                path = cls._driver_paths.get(browser)
+                if path is None:
+                    module_name, class_name = _DRIVER_MANAGERS[browser]
+                    manager = getattr(importlib.import_module(module_name), class_name)
+                    path = manager().install()
+                    cls._driver_paths[browser] = path
+                    logger.debug(f"Resolved {browser} driver binary: {path}")
+        return path
+    
+    @staticmethod
+    def _pin_loopback(driver: webdriver.Remote) -> None:
+        """
+        Point a local driver's command executor at 127.0.0.1 instead of
+        'localhost', so commands skip name resolution (and an IPv6 attempt).
+        """
+        executor = driver.command_executor
+        client_config = getattr(executor, "_client_config", None)
+        if client_config is not None:
+            # Newer Selenium releases keep the server address in ClientConfig
+            client_config.remote_server_addr = client_config.remote_server_addr.replace(
+                "//localhost:", "//127.0.0.1:", 1
+            )
+        elif hasattr(executor, "_url"):
+            executor._url = executor._url.replace("//localhost:", "//127.0.0.1:", 1)
     
     def _create_remote_driver(self) -> webdriver.Remote:
         """Create Remote WebDriver for Selenium Grid."""
@@ -136,11 +197,12 @@ class DriverFactory:
         options = ChromeOptions() if self.browser == "chrome" else FirefoxOptions()
         
         if self.headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new" if self.browser == "chrome" else "--headless")
             
         return webdriver.Remote(
             command_executor=self.remote_url,
-            options=options
+            options=options,
+            keep_alive=True
         )
     
     def _configure_driver(self) -> None:
@@ -148,8 +210,9 @@ class DriverFactory:
         if not self.driver:
             return
             
-        # Timeouts
-        self.driver.implicitly_wait(10)
+        # Timeouts (no implicit wait: BasePage waits explicitly, and an implicit
+        # wait would stall every lookup of an element that is legitimately absent)
+        self.driver.implicitly_wait(0)
         self.driver.set_page_load_timeout(30)
         self.driver.set_script_timeout(30)
         
@@ -177,3 +240,110 @@ class DriverFactory:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.quit_driver()
+
+
+class DriverPool:
+    """
+    Pool of reusable WebDriver sessions.
+    Released drivers are reset (cookies, storage) and parked on a fresh load
+    of home_url (or a blank page), then handed out again by acquire() instead
+    of paying a fresh browser start per test.
+    Each pytest-xdist worker is its own process, so pools are per worker.
+    Remaining drivers are quit at interpreter exit if quit_all() was not called.
+    """
+    
+    # Clears per-test browser state; storage access throws on about:blank
+    _RESET_SCRIPT = (
+        "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+    )
+    
+    def __init__(self, remote_url: Optional[str] = None,
+                 home_url: Optional[str] = None, max_idle: Optional[int] = None):
+        """
+        Initialize the DriverPool.
+        
+        Args:
+            remote_url: Selenium Grid/Remote WebDriver URL for new drivers
+            home_url: Page released drivers are parked on, so the next test
+                can skip its own initial navigation (about:blank if None)
+            max_idle: Idle drivers kept per browser kind (default: CPU count);
+                drivers released beyond that are quit
+        """
+        self.remote_url = remote_url
+        self.home_url = home_url
+        self.max_idle = max_idle or os.cpu_count() or 1
+        self._idle: Dict[Tuple[str, bool], List[webdriver.Remote]] = {}
+        self._factories: Dict[int, Tuple[Tuple[str, bool], DriverFactory]] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.quit_all)
+    
+    def acquire(self, browser: str = "chrome", headless: bool = False) -> webdriver.Remote:
+        """
+        Get an idle driver for the browser kind, creating one if none is free.
+        
+        Args:
+            browser: Browser type (chrome, firefox, edge)
+            headless: Run in headless mode
+        
+        Returns:
+            WebDriver instance owned by the pool
+        """
+        key = (browser.lower(), headless)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                driver = idle.pop()
+                logger.info(f"Reusing pooled {key[0]} driver: {driver.session_id}")
+                return driver
+        
+        factory = DriverFactory(browser=browser, headless=headless,
+                                remote_url=self.remote_url)
+        driver = factory.create_driver()
+        with self._lock:
+            self._factories[id(driver)] = (key, factory)
+        return driver
+    
+    def release(self, driver: webdriver.Remote) -> None:
+        """
+        Reset driver state and return it to the pool.
+        Drivers that fail to reset (e.g. crashed browser) or that would exceed
+        max_idle are quit instead.
+        """
+        entry = self._factories.get(id(driver))
+        if entry is None:
+            logger.warning("Released driver does not belong to this pool")
+            return
+        key, factory = entry
+        
+        with self._lock:
+            full = len(self._idle.get(key, ())) >= self.max_idle
+            if full:
+                self._factories.pop(id(driver), None)
+        if full:
+            logger.info(f"Pool full, quitting released driver: {driver.session_id}")
+            factory.quit_driver()
+            return
+        
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(self._RESET_SCRIPT)
+            driver.get(self.home_url or "about:blank")
+        except Exception as e:
+            logger.warning(f"Discarding driver that failed to reset: {e}")
+            with self._lock:
+                self._factories.pop(id(driver), None)
+            factory.quit_driver()
+            return
+        
+        with self._lock:
+            self._idle.setdefault(key, []).append(driver)
+    
+    def quit_all(self) -> None:
+        """Quit every driver created by the pool."""
+        with self._lock:
+            factories = [factory for _, factory in self._factories.values()]
+            self._factories.clear()
+            self._idle.clear()
+        
+        for factory in factories:
+            factory.quit_driver()
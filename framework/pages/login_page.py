@@ -3,21 +3,74 @@ Login Page Object - SauceDemo Application
 Demonstrates Page Object Model implementation
 """
 
+import os
+from typing import Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from framework.core.base_page import BasePage
 from loguru import logger
 
 
+# Poll for a visible element inside the browser; resolves to its text or null
+_VISIBLE_TEXT_JS = """
+var selector = arguments[0], deadline = Date.now() + arguments[1];
+var done = arguments[arguments.length - 1];
+(function poll() {
+    var element = document.querySelector(selector);
+    if (element && element.getClientRects().length) { return done(element.innerText); }
+    if (Date.now() >= deadline) { return done(null); }
+    setTimeout(poll, 50);
+})();
+"""
+
+# Fill both inputs and submit in one call. React tracks input values itself, so
+# the native setter plus an 'input' event is needed for it to see the change.
+_FAST_LOGIN_JS = """
+var username = document.querySelector(arguments[0]);
+var password = document.querySelector(arguments[1]);
+var button = document.querySelector(arguments[2]);
+if (!username || !password || !button) { return false; }
+var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+[[username, arguments[3]], [password, arguments[4]]].forEach(function (pair) {
+    setValue.call(pair[0], pair[1]);
+    pair[0].dispatchEvent(new Event('input', {bubbles: true}));
+});
+button.click();
+return true;
+"""
+
+# Dismiss the error banner and empty both inputs (React-aware, as above)
+_RESET_FORM_JS = """
+var inputs = [document.querySelector(arguments[0]), document.querySelector(arguments[1])];
+if (!inputs[0] || !inputs[1]) { return false; }
+var close = document.querySelector(arguments[2]);
+if (close) { close.click(); }
+var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+inputs.forEach(function (input) {
+    setValue.call(input, '');
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+});
+return true;
+"""
+
+
 class LoginPage(BasePage):
     """
     Page Object for SauceDemo Login Page.
     Inherits all methods from BasePage.
     """
     
+    __slots__ = ()
+    
     # Page URL
     URL = "https://www.saucedemo.com"
     
+    # Seconds to wait for the error banner (rendered within ~100ms of submit)
+    ERROR_TIMEOUT = 2
+    
+    # login() uses the single-script login_fast() when FAST_LOGIN is set
+    FAST_LOGIN = os.getenv("FAST_LOGIN", "").lower() in ("1", "true", "yes", "on")
+    
     # Locators (using tuple format for maintainability)
     USERNAME_INPUT = (By.ID, "user-name")
     PASSWORD_INPUT = (By.ID, "password")
@@ -31,6 +84,14 @@ class LoginPage(BasePage):
     PRODUCTS_TITLE = (By.CSS_SELECTOR, ".title")
     INVENTORY_CONTAINER = (By.ID, "inventory_container")
     
+    # CSS equivalents, precomputed for in-browser (execute_script) lookups
+    USERNAME_CSS = BasePage._css(USERNAME_INPUT)
+    PASSWORD_CSS = BasePage._css(PASSWORD_INPUT)
+    LOGIN_BUTTON_CSS = BasePage._css(LOGIN_BUTTON)
+    ERROR_MESSAGE_CSS = BasePage._css(ERROR_MESSAGE)
+    ERROR_BUTTON_CSS = BasePage._css(ERROR_BUTTON)
+    LOGO_CSS = BasePage._css(LOGO)
+    
     def __init__(self, driver: WebDriver):
         """Initialize Login Page."""
         super().__init__(driver)
@@ -39,14 +100,35 @@ class LoginPage(BasePage):
     def navigate(self) -> 'LoginPage':
         """
         Navigate to login page.
+        Skipped when the browser is already on it, so repeated calls are cheap.
         
         Returns:
             Self for method chaining
         """
+        if self.driver.current_url.rstrip('/') == self.URL.rstrip('/'):
+            logger.debug("Already on login page, skipping navigation")
+            return self
         self.navigate_to(self.URL)
         self.wait_for_page_load()
         return self
         
+    def reset(self) -> 'LoginPage':
+        """
+        Clear inputs and any error message.
+        Done in place with one script call; the page is only reloaded when
+        the login form is not on screen (e.g. after a successful login).
+        
+        Returns:
+            Self for method chaining
+        """
+        logger.debug("Resetting login page")
+        if not self.driver.execute_script(
+            _RESET_FORM_JS, self.USERNAME_CSS, self.PASSWORD_CSS, self.ERROR_BUTTON_CSS
+        ):
+            self.navigate_to(self.URL)
+            self.wait_for_page_load()
+        return self
+    
     def wait_for_page_load(self) -> None:
         """Wait for login page to load completely."""
         self.wait_for_element(self.LOGO, timeout=10)
@@ -89,16 +171,38 @@ class LoginPage(BasePage):
     def login(self, username: str, password: str) -> None:
         """
         Complete login flow.
+        With FAST_LOGIN set, uses login_fast() when the form is rendered.
         
         Args:
             username: Username
             password: Password
         """
+        if self.FAST_LOGIN and self.login_fast(username, password):
+            return
         logger.info(f"Logging in with user: {username}")
         self.enter_username(username)
         self.enter_password(password)
         self.click_login()
         
+    def login_fast(self, username: str, password: str) -> bool:
+        """
+        Fill credentials and submit with a single script call.
+        Skips real keyboard/mouse events, so keep login() for flows that
+        exercise them.
+        
+        Args:
+            username: Username
+            password: Password
+        
+        Returns:
+            True if submitted, False if the form was not rendered yet
+        """
+        logger.info(f"Fast login with user: {username}")
+        return self.driver.execute_script(
+            _FAST_LOGIN_JS, self.USERNAME_CSS, self.PASSWORD_CSS,
+            self.LOGIN_BUTTON_CSS, username, password
+        )
+    
     def is_error_displayed(self) -> bool:
         """
         Check if error message is displayed.
@@ -106,7 +210,7 @@ class LoginPage(BasePage):
         Returns:
             True if error is displayed, False otherwise
         """
-        return self.is_element_visible(self.ERROR_MESSAGE, timeout=3)
+        return self._get_error_raw() is not None
         
     def get_error_message(self) -> str:
         """
@@ -115,11 +219,23 @@ class LoginPage(BasePage):
         Returns:
             Error message text
         """
-        if self.is_error_displayed():
-            error_text = self.get_text(self.ERROR_MESSAGE)
-            logger.info(f"Error message: {error_text}")
-            return error_text
-        return ""
+        error_text = self._get_error_raw()
+        if error_text is None:
+            return ""
+        logger.info(f"Error message: {error_text}")
+        return error_text
+    
+    def _get_error_raw(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the error message inside the browser in a single round-trip.
+        
+        Returns:
+            Error text once visible, None if it did not appear within timeout
+        """
+        timeout = self.ERROR_TIMEOUT if timeout is None else timeout
+        return self.driver.execute_async_script(
+            _VISIBLE_TEXT_JS, self.ERROR_MESSAGE_CSS, timeout * 1000
+        )
         
     def clear_error(self) -> 'LoginPage':
         """
@@ -179,16 +295,19 @@ class LoginPage(BasePage):
         """
         logger.info("Validating login page elements")
         
-        elements_to_check = [
-            (self.USERNAME_INPUT, "Username field"),
-            (self.PASSWORD_INPUT, "Password field"),
-            (self.LOGIN_BUTTON, "Login button"),
-            (self.LOGO, "Logo"),
-        ]
+        elements_to_check = {
+            "Username field": self.USERNAME_INPUT,
+            "Password field": self.PASSWORD_INPUT,
+            "Login button": self.LOGIN_BUTTON,
+            "Logo": self.LOGO,
+        }
+        
+        # One browser round-trip for all locators
+        present = self.are_present(elements_to_check)
         
         all_present = True
-        for locator, name in elements_to_check:
-            if not self.is_element_present(locator):
+        for name, is_present in present.items():
+            if not is_present:
                 logger.error(f"Missing element: {name}")
                 all_present = False
             else:
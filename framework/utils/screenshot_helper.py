@@ -3,20 +3,50 @@ Screenshot Helper - Capture and manage test screenshots
 Supports failure screenshots, comparison, and annotations
 """
 
+import base64
+import itertools
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 from selenium.webdriver.remote.webdriver import WebDriver
-from PIL import Image, ImageDraw, ImageFont
-import cv2
-import numpy as np
 from loguru import logger
 
+# Pillow, OpenCV and NumPy are imported inside the methods that use them, so
+# importing this module (e.g. from conftest at collection time) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image, ImageFont
+
+
+# Filename suffix parts: one timestamp per run plus a process-wide counter,
+# so captures never collide within a second or across xdist workers
+_RUN_ID = datetime.now().strftime("%Y%m%d_%H%M%S")
+_capture_counter = itertools.count()
+
 
 class ScreenshotHelper:
     """Helper class for capturing and managing screenshots."""
     
+    # Perceptual-hash distance (out of 64 bits) above which SSIM is skipped
+    DHASH_MAX_DISTANCE = 10
+    
+    # Longest side (px) screenshots are downsampled to before SSIM
+    SSIM_MAX_SIDE = 720
+    
+    # PSNR (dB) at or above which screenshots count as identical and SSIM is
+    # skipped; small high-contrast changes drop PSNR sharply, so low PSNR
+    # never rejects on its own
+    PSNR_IDENTICAL_DB = 60.0
+    
+    # Annotation font, loaded once per process (see _annotation_font)
+    ANNOTATION_FONT = "DejaVuSans.ttf"
+    ANNOTATION_FONT_SIZE = 14
+    _font = None
+    
     def __init__(self, driver: WebDriver, screenshots_dir: str = "screenshots"):
         """
         Initialize Screenshot Helper.
@@ -29,9 +59,15 @@ class ScreenshotHelper:
         self.screenshots_dir = Path(screenshots_dir)
         self.screenshots_dir.mkdir(parents=True, exist_ok=True)
         
+    @staticmethod
+    def unique_suffix() -> str:
+        """Return a collision-free filename suffix: <run>_<worker>_<counter>."""
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return f"{_RUN_ID}_{worker}_{next(_capture_counter)}"
+    
     def capture_screenshot(self, name: str, prefix: str = "") -> str:
         """
-        Capture screenshot with timestamp.
+        Capture screenshot with a unique run/worker/counter suffix.
         
         Args:
             name: Screenshot name
@@ -40,8 +76,8 @@ class ScreenshotHelper:
         Returns:
             Path to saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{prefix}_{name}_{timestamp}.png" if prefix else f"{name}_{timestamp}.png"
+        suffix = self.unique_suffix()
+        filename = f"{prefix}_{name}_{suffix}.png" if prefix else f"{name}_{suffix}.png"
         filepath = self.screenshots_dir / filename
         
         try:
@@ -75,8 +111,8 @@ class ScreenshotHelper:
         Returns:
             Path to saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"element_{name}_{timestamp}.png"
+        suffix = self.unique_suffix()
+        filename = f"element_{name}_{suffix}.png"
         filepath = self.screenshots_dir / filename
         
         try:
@@ -91,48 +127,114 @@ class ScreenshotHelper:
         """
         Capture full page screenshot (including scrollable area).
         
+        Chromium drivers render the whole page in one DevTools call; other
+        browsers (or a failed CDP call) fall back to scrolling and stitching.
+        
         Args:
             name: Screenshot name
             
         Returns:
             Path to saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"fullpage_{name}_{timestamp}.png"
+        suffix = self.unique_suffix()
+        filename = f"fullpage_{name}_{suffix}.png"
         filepath = self.screenshots_dir / filename
         
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            try:
+                return self._capture_full_page_cdp(filepath)
+            except Exception as e:
+                logger.warning(f"CDP full page capture failed, stitching instead: {e}")
+        
+        import io
+        import numpy as np
+        from PIL import Image
+        
         try:
-            # Get page dimensions
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
-            total_width = self.driver.execute_script("return document.body.scrollWidth")
-            
-            # Scroll and capture screenshots
-            screenshots = []
-            for offset in range(0, total_height, viewport_height):
-                self.driver.execute_script(f"window.scrollTo(0, {offset})")
-                screenshot = self.driver.get_screenshot_as_png()
-                screenshots.append(Image.open(io.BytesIO(screenshot)))
-                
-            # Stitch screenshots together
-            full_screenshot = Image.new('RGB', (total_width, total_height))
-            y_offset = 0
-            for screenshot in screenshots:
-                full_screenshot.paste(screenshot, (0, y_offset))
-                y_offset += screenshot.height
+            # Get page dimensions in a single round-trip
+            total_height, viewport_height, total_width = self.driver.execute_script(
+                "return [document.body.scrollHeight, window.innerHeight, "
+                "document.body.scrollWidth];"
+            )
+            offsets = range(0, total_height, viewport_height)
+            
+            # Capture tiles on a worker thread while this thread decodes and
+            # stitches the previous ones; the bounded queue keeps memory flat
+            tiles: queue.Queue = queue.Queue(maxsize=2)
+            stop = threading.Event()
+            
+            def capture_tiles() -> None:
+                try:
+                    for offset in offsets:
+                        if stop.is_set():
+                            break
+                        # Browser clamps the last scroll, so paste at the real offset
+                        actual_offset = self.driver.execute_script(
+                            "window.scrollTo(0, arguments[0]); return window.pageYOffset;",
+                            offset
+                        )
+                        tiles.put((actual_offset, self.driver.get_screenshot_as_png()))
+                finally:
+                    tiles.put(None)
+            
+            # One preallocated RGB canvas; zeros is lazily allocated and keeps
+            # any area not covered by a tile black, as Image.new did
+            canvas = np.zeros((total_height, total_width, 3), dtype=np.uint8)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                producer = executor.submit(capture_tiles)
+                try:
+                    while True:
+                        tile = tiles.get()
+                        if tile is None:
+                            break
+                        offset, png = tile
+                        tile_pixels = np.asarray(Image.open(io.BytesIO(png)).convert('RGB'))
+                        height = min(tile_pixels.shape[0], total_height - offset)
+                        width = min(tile_pixels.shape[1], total_width)
+                        canvas[offset:offset + height, :width] = tile_pixels[:height, :width]
+                finally:
+                    # Unblock the producer if stitching failed mid-way
+                    stop.set()
+                    while not producer.done():
+                        try:
+                            tiles.get(timeout=0.1)
+                        except queue.Empty:
+                            pass
+                producer.result()
                 
-            full_screenshot.save(filepath)
+            # Fast PNG compression: much cheaper on tall pages, slightly larger files
+            Image.fromarray(canvas).save(filepath, compress_level=1)
             logger.info(f"Full page screenshot saved: {filepath}")
             return str(filepath)
         except Exception as e:
             logger.error(f"Failed to capture full page screenshot: {e}")
             return ""
             
+    def _capture_full_page_cdp(self, filepath: Path) -> str:
+        """Capture the full page via Page.captureScreenshot, clipped to the content size."""
+        metrics = self.driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+        content = metrics.get("cssContentSize") or metrics["contentSize"]
+        result = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+            "format": "png",
+            "fromSurface": True,
+            "captureBeyondViewport": True,
+            "clip": {"x": 0, "y": 0, "width": content["width"],
+                     "height": content["height"], "scale": 1},
+        })
+        filepath.write_bytes(base64.b64decode(result["data"]))
+        logger.info(f"Full page screenshot saved: {filepath}")
+        return str(filepath)
+    
     def compare_screenshots(self, baseline: str, current: str, 
                           threshold: float = 0.95) -> tuple[bool, float]:
         """
         Compare two screenshots for visual regression.
         
+        A 64-bit difference hash is compared first; clearly different images
+        are rejected without running SSIM and scored 0.0. Near-identical images
+        (PSNR >= PSNR_IDENTICAL_DB) are scored 1.0; everything else is scored
+        by SSIM.
+        
         Args:
             baseline: Path to baseline screenshot
             current: Path to current screenshot
@@ -141,22 +243,46 @@ class ScreenshotHelper:
         Returns:
             Tuple of (match, similarity_score)
         """
+        import cv2
+        
         try:
-            # Load images
-            img1 = cv2.imread(baseline)
             img2 = cv2.imread(current)
             
+            # Cheap perceptual pre-filter before full-resolution SSIM
+            distance = self._hash_distance(self._baseline_dhash(baseline), self._dhash(img2))
+            if distance > self.DHASH_MAX_DISTANCE:
+                # Not an SSIM estimate; 0.0 keeps the score below any threshold
+                logger.info(f"Screenshot comparison: hashes differ by {distance} bits, skipping SSIM")
+                return False, 0.0
+            
+            img1 = cv2.imread(baseline)
+            
             # Ensure same dimensions
             if img1.shape != img2.shape:
                 img2 = cv2.resize(img2, (img1.shape[1], img1.shape[0]))
                 
-            # Convert to grayscale
-            gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-            gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+            # Downsample large screenshots; layout regressions survive at 720px
+            scale = self.SSIM_MAX_SIDE / max(img1.shape[:2])
+            if scale < 1:
+                img1 = cv2.resize(img1, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                img2 = cv2.resize(img2, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
             
-            # Compute SSIM
-            from skimage.metrics import structural_similarity as ssim
-            similarity = ssim(gray1, gray2)
+            # Single-pass PSNR on the BGR images settles near-identical
+            # screenshots without the SSIM/grayscale cost
+            if cv2.PSNR(img1, img2) >= self.PSNR_IDENTICAL_DB:
+                similarity = 1.0
+            else:
+                # Convert to grayscale
+                gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
+                gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+                
+                # Compute SSIM (compiled OpenCV kernel from opencv-contrib when available)
+                quality = getattr(cv2, "quality", None)
+                if quality is not None:
+                    similarity = quality.QualitySSIM_compute(gray1, gray2)[0][0]
+                else:
+                    from skimage.metrics import structural_similarity as ssim
+                    similarity = ssim(gray1, gray2)
             
             match = similarity >= threshold
             logger.info(f"Screenshot comparison: {similarity:.2%} similarity")
@@ -166,41 +292,109 @@ class ScreenshotHelper:
             logger.error(f"Screenshot comparison failed: {e}")
             return False, 0.0
             
-    def annotate_screenshot(self, image_path: str, text: str, 
-                          position: tuple = (10, 10)) -> str:
+    @staticmethod
+    def _dhash(image: "np.ndarray") -> bytes:
+        """Compute a 64-bit difference hash (8 bytes) of a BGR image."""
+        import cv2
+        import numpy as np
+        
+        # Shrink first so the grayscale conversion only touches 72 pixels
+        small = cv2.resize(image, (9, 8), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return np.packbits(gray[:, 1:] > gray[:, :-1]).tobytes()
+    
+    @staticmethod
+    def _hash_distance(hash1: bytes, hash2: bytes) -> int:
+        """Hamming distance between two hashes."""
+        return bin(int.from_bytes(hash1, "big") ^ int.from_bytes(hash2, "big")).count("1")
+    
+    def _baseline_dhash(self, baseline: str) -> bytes:
+        """
+        Get the baseline's hash, cached in a '<baseline>.dhash' sidecar file
+        that is reused while it is at least as new as the baseline image.
+        """
+        sidecar = Path(f"{baseline}.dhash")
+        try:
+            if sidecar.stat().st_mtime >= Path(baseline).stat().st_mtime:
+                return sidecar.read_bytes()
+        except OSError:
+            pass
+        
+        import cv2
+        baseline_hash = self._dhash(cv2.imread(baseline))
+        try:
+            sidecar.write_bytes(baseline_hash)
+        except OSError as e:
+            logger.debug(f"Could not cache baseline hash {sidecar}: {e}")
+        return baseline_hash
+    
+    def annotate_screenshot(self, image: Union[str, Path, bytes, "Image.Image", "np.ndarray"],
+                            text: str, position: tuple = (10, 10),
+                            output_path: Optional[str] = None) -> str:
         """
         Add annotation text to screenshot.
         
+        In-memory images (PNG bytes from get_screenshot_as_png(), a PIL image
+        or an RGB array) are annotated directly, skipping a disk re-read.
+        
         Args:
-            image_path: Path to screenshot
+            image: Screenshot path, PNG bytes, PIL image or RGB array
             text: Annotation text
             position: Text position (x, y)
+            output_path: Where to save; defaults to '<image>_annotated.png'
+                for paths and a uniquely named file in screenshots_dir otherwise
             
         Returns:
             Path to annotated screenshot
         """
+        if output_path is None:
+            if isinstance(image, (str, Path)):
+                output_path = str(image).replace('.png', '_annotated.png')
+            else:
+                suffix = self.unique_suffix()
+                output_path = str(self.screenshots_dir / f"annotated_{suffix}.png")
+        
+        import io
+        from PIL import Image, ImageDraw
+        
         try:
-            img = Image.open(image_path)
+            if isinstance(image, (str, Path)):
+                img = Image.open(image)
+            elif isinstance(image, bytes):
+                img = Image.open(io.BytesIO(image))
+            elif isinstance(image, Image.Image):
+                img = image.copy()
+            else:
+                img = Image.fromarray(image)
             draw = ImageDraw.Draw(img)
-            
-            # Use default font
-            font = ImageFont.load_default()
+            font = self._annotation_font()
             
             # Add text with background
             bbox = draw.textbbox(position, text, font=font)
             draw.rectangle(bbox, fill='yellow')
             draw.text(position, text, fill='black', font=font)
             
-            # Save annotated image
-            annotated_path = image_path.replace('.png', '_annotated.png')
-            img.save(annotated_path)
-            logger.info(f"Annotated screenshot saved: {annotated_path}")
+            # Save annotated image (fast zlib level; screenshots are throwaway)
+            img.save(output_path, compress_level=1)
+            logger.info(f"Annotated screenshot saved: {output_path}")
             
-            return annotated_path
+            return output_path
         except Exception as e:
             logger.error(f"Failed to annotate screenshot: {e}")
-            return image_path
+            return str(image) if isinstance(image, (str, Path)) else ""
             
+    @classmethod
+    def _annotation_font(cls) -> "ImageFont.ImageFont":
+        """Load the TrueType annotation font once; fall back to PIL's bitmap font."""
+        if cls._font is None:
+            from PIL import ImageFont
+            try:
+                cls._font = ImageFont.truetype(cls.ANNOTATION_FONT, cls.ANNOTATION_FONT_SIZE)
+            except OSError:
+                logger.debug(f"{cls.ANNOTATION_FONT} not found, using default font")
+                cls._font = ImageFont.load_default()
+        return cls._font
+    
     def cleanup_old_screenshots(self, days: int = 7) -> None:
         """
         Remove screenshots older than specified days.
@@ -211,13 +405,11 @@ class ScreenshotHelper:
         cutoff = datetime.now().timestamp() - (days * 86400)
         count = 0
         
-        for file in self.screenshots_dir.glob("*.png"):
-            if file.stat().st_mtime < cutoff:
-                file.unlink()
-                count += 1
+        # scandir avoids building a Path object per file
+        with os.scandir(self.screenshots_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".png") and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    count += 1
                 
         logger.info(f"Cleaned up {count} old screenshots")
-
-
-# Fix missing import
-import io
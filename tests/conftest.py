@@ -3,16 +3,28 @@ Pytest Configuration and Fixtures
 Provides reusable fixtures for test setup and teardown
 """
 
+import os
+import shutil
+import sys
+import tempfile
 import pytest
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from selenium.webdriver.remote.webdriver import WebDriver
-from framework.core.driver_factory import DriverFactory
+from framework.core.driver_factory import DriverPool
 from framework.config.config_manager import config
 from framework.utils.screenshot_helper import ScreenshotHelper
 from loguru import logger
 
 
+# RAM-backed directory Allure results are staged in when available
+_TMPFS_DIR = "/dev/shm"
+
+# Final Allure results directory when results are staged on tmpfs
+_ALLURE_FINAL_DIR = pytest.StashKey[str]()
+
+
 # ============= Session-Level Fixtures =============
 
 @pytest.fixture(scope="session", autouse=True)
@@ -23,11 +35,13 @@ def setup_logging():
     
     log_file = log_dir / f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     
-    logger.add(
+    # enqueue=True: records are written by loguru's worker thread, not the test
+    sink_id = logger.add(
         log_file,
         rotation="100 MB",
         retention="30 days",
         level=config.log_level,
+        enqueue=True,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}"
     )
     
@@ -43,6 +57,9 @@ def setup_logging():
     logger.info("=" * 80)
     logger.info("TEST SESSION COMPLETED")
     logger.info("=" * 80)
+    
+    # Flushes the queued records and closes the file
+    logger.remove(sink_id)
 
 
 @pytest.fixture(scope="session")
@@ -51,35 +68,91 @@ def test_config():
     return config
 
 
-# ============= Function-Level Fixtures =============
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Provide a session-wide pool of WebDriver instances.
+    Browsers are reused across tests and quit once at session end; between
+    tests they are reset and parked on a fresh load of the base URL.
+    """
+    pool = DriverPool(home_url=config.base_url)
+    
+    yield pool
+    
+    logger.info("Quitting pooled drivers")
+    pool.quit_all()
 
-@pytest.fixture(scope="function")
-def driver(request):
+
+def _env_flag(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _resolve_headless(pytest_config) -> bool:
     """
-    Create WebDriver instance for each test.
-    Handles setup and teardown automatically.
+    Decide headless mode: --headless flag, then the HEADLESS env var
+    (defaults to true when CI is set), then browser.headless from config.
     """
+    if pytest_config.getoption("--headless"):
+        return True
+    
+    env_value = os.environ.get("HEADLESS")
+    if env_value is None and _env_flag(os.environ.get("CI", "")):
+        return True
+    if env_value is not None:
+        return _env_flag(env_value)
+    
+    return bool(config.headless)
+
+
+def _acquire_driver(request, driver_pool) -> WebDriver:
+    """Check out a pooled driver for the requesting node (test or class)."""
     # Get browser settings from config
     browser = config.browser_type
-    headless = config.headless
+    headless = _resolve_headless(request.config)
     
     # Allow override via pytest CLI
     browser = request.config.getoption("--browser", browser)
     
-    logger.info(f"Initializing {browser} driver for test: {request.node.name}")
+    logger.info(f"Acquiring {browser} driver for: {request.node.name}")
     
-    # Create driver
-    driver_factory = DriverFactory(browser=browser, headless=headless)
-    driver_instance = driver_factory.create_driver()
+    # Check out a driver (reused if one is idle)
+    driver_instance = driver_pool.acquire(browser=browser, headless=headless)
     
     # Store driver in request for screenshot on failure
     request.node._driver = driver_instance
+    return driver_instance
+
+
+@pytest.fixture(scope="class")
+def class_driver(request, driver_pool):
+    """
+    Provide one pooled WebDriver instance shared by all tests of a class.
+    Tests using it must reset page state themselves.
+    """
+    driver_instance = _acquire_driver(request, driver_pool)
+    
+    yield driver_instance
+    
+    logger.info(f"Releasing driver for class: {request.node.name}")
+    driver_pool.release(driver_instance)
+
+
+# ============= Function-Level Fixtures =============
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
+    """
+    Provide a pooled WebDriver instance for each test.
+    The driver is reset and returned to the pool after the test.
+    """
+    driver_instance = _acquire_driver(request, driver_pool)
     
     yield driver_instance
     
     # Teardown
-    logger.info(f"Tearing down driver for test: {request.node.name}")
-    driver_factory.quit_driver()
+    logger.info(f"Releasing driver for test: {request.node.name}")
+    driver_pool.release(driver_instance)
 
 
 @pytest.fixture(scope="function")
@@ -95,11 +168,27 @@ def login_page(driver):
     """
     Provide Login Page Object instance.
     Automatically navigates to login page.
+    The page object is memoized on the driver, so a pooled browser keeps one
+    LoginPage; navigate() is a no-op when the browser is already there.
     """
     from framework.pages.login_page import LoginPage
-    page = LoginPage(driver)
-    page.navigate()
-    return page
+    page = getattr(driver, "_login_page", None)
+    if page is None:
+        page = driver._login_page = LoginPage(driver)
+    else:
+        # The pool reloaded the page since the last test; cached elements are stale
+        page.clear_element_cache()
+    return page.navigate()
+
+
+@pytest.fixture(scope="class")
+def login_page_class(class_driver):
+    """
+    Provide one Login Page Object per test class (for data-driven classes).
+    Tests call login_page.reset() instead of getting a fresh page.
+    """
+    from framework.pages.login_page import LoginPage
+    return LoginPage(class_driver).navigate()
 
 
 # ============= Pytest Hooks =============
@@ -137,20 +226,21 @@ def pytest_runtest_makereport(item, call):
     
     # Only capture on test call phase (not setup/teardown)
     if report.when == "call":
-        # Get driver from item if available
-        driver = getattr(item, "_driver", None)
+        # Get driver from item (or its class, for class-scoped drivers)
+        driver = getattr(item, "_driver", None) or getattr(item.parent, "_driver", None)
         
         if report.failed and driver:
             # Capture screenshot on failure
             screenshot_dir = Path("screenshots")
             screenshot_dir.mkdir(exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_name = f"FAIL_{item.name}_{timestamp}.png"
+            screenshot_name = f"FAIL_{item.name}_{ScreenshotHelper.unique_suffix()}.png"
             screenshot_path = screenshot_dir / screenshot_name
             
             try:
-                driver.save_screenshot(str(screenshot_path))
+                # Capture once; the same PNG bytes go to disk and to Allure
+                png = driver.get_screenshot_as_png()
+                screenshot_path.write_bytes(png)
                 logger.error(f"Test failed: {item.name}")
                 logger.error(f"Screenshot saved: {screenshot_path}")
                 
@@ -158,7 +248,7 @@ def pytest_runtest_makereport(item, call):
                 try:
                     import allure
                     allure.attach(
-                        driver.get_screenshot_as_png(),
+                        png,
                         name=f"failure_{item.name}",
                         attachment_type=allure.attachment_type.PNG
                     )
@@ -169,6 +259,7 @@ def pytest_runtest_makereport(item, call):
                 logger.error(f"Failed to capture screenshot: {e}")
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
     config.addinivalue_line(
@@ -180,24 +271,67 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "critical: Critical path tests"
     )
+    
+    # Console gets warnings and up by default (LOG_LEVEL=INFO for chatty runs);
+    # the session log file keeps the configured level
+    logger.remove()
+    logger.add(sys.stderr, level=os.getenv("LOG_LEVEL", "WARNING"))
+    
+    # One Allure results shard per xdist worker so parallel writers never
+    # clobber each other (runs before allure-pytest reads the option)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if not report_dir:
+        return
+    if worker:
+        report_dir = os.path.join(report_dir, worker)
+    
+    # Stage the many small result files on tmpfs; pytest_sessionfinish moves
+    # them into the shard. Cleaning happens here, before any worker starts.
+    if os.access(_TMPFS_DIR, os.W_OK) and not config.option.collectonly:
+        if getattr(config.option, "clean_alluredir", False):
+            shutil.rmtree(report_dir, ignore_errors=True)
+        config.stash[_ALLURE_FINAL_DIR] = report_dir
+        report_dir = tempfile.mkdtemp(prefix="allure-", dir=_TMPFS_DIR)
+    config.option.allure_report_dir = report_dir
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Move Allure results staged on tmpfs into their results directory."""
+    final_dir = session.config.stash.get(_ALLURE_FINAL_DIR, None)
+    if final_dir is None:
+        return
+    
+    staging_dir = session.config.option.allure_report_dir
+    os.makedirs(final_dir, exist_ok=True)
+    with os.scandir(staging_dir) as entries:
+        for entry in entries:
+            shutil.move(entry.path, os.path.join(final_dir, entry.name))
+    os.rmdir(staging_dir)
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection (e.g., skip tests based on markers)."""
     skip_ci = pytest.mark.skip(reason="Skipped in CI environment")
+    skip_serial = pytest.mark.skip(reason="Timing-sensitive; run with -n 0 -m serial")
+    in_xdist_worker = "PYTEST_XDIST_WORKER" in os.environ
     
     for item in items:
         if "skip_ci" in item.keywords and config.getoption("--ci", False):
             item.add_marker(skip_ci)
+        if in_xdist_worker and "serial" in item.keywords:
+            item.add_marker(skip_serial)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_data():
     """
     Provide test data for tests.
     Can be extended to load from files, databases, etc.
+    Built once per session and read-only, so tests cannot leak changes.
     """
-    return {
+    users = {
         "valid_user": {
             "username": "standard_user",
             "password": "secret_sauce"
@@ -211,20 +345,25 @@ def test_data():
             "password": "wrong_password"
         }
     }
+    return MappingProxyType({name: MappingProxyType(user) for name, user in users.items()})
+
+
+_TEST_BANNER = "=" * 60
 
 
 @pytest.fixture(autouse=True)
 def log_test_name(request):
     """Log test name at start and end."""
-    logger.info(f"{'=' * 60}")
-    logger.info(f"Starting test: {request.node.name}")
-    logger.info(f"{'=' * 60}")
+    # Brace-style args: formatted only if a sink accepts the record
+    logger.info(_TEST_BANNER)
+    logger.info("Starting test: {}", request.node.name)
+    logger.info(_TEST_BANNER)
     
     yield
     
-    logger.info(f"{'=' * 60}")
-    logger.info(f"Finished test: {request.node.name}")
-    logger.info(f"{'=' * 60}")
+    logger.info(_TEST_BANNER)
+    logger.info("Finished test: {}", request.node.name)
+    logger.info(_TEST_BANNER)
 
 
 # ============= Performance Monitoring =============
@@ -233,24 +372,29 @@ def log_test_name(request):
 def performance_monitor(driver):
     """Monitor page performance metrics."""
     class PerformanceMonitor:
+        _TIMING_JS = "return window.performance.timing.toJSON();"
+        
+        def __init__(self):
+            self._timing = None
+        
+        def timing(self):
+            """Fetch window.performance.timing once; refetch until the load event ends."""
+            if self._timing is None or not self._timing["loadEventEnd"]:
+                self._timing = driver.execute_script(self._TIMING_JS)
+            return self._timing
+        
+        def reset(self):
+            """Drop cached timings (call after navigating to another page)."""
+            self._timing = None
+        
         def get_page_load_time(self):
             """Get page load time in seconds."""
-            navigation_start = driver.execute_script(
-                "return window.performance.timing.navigationStart"
-            )
-            load_complete = driver.execute_script(
-                "return window.performance.timing.loadEventEnd"
-            )
-            return (load_complete - navigation_start) / 1000
+            timing = self.timing()
+            return (timing["loadEventEnd"] - timing["navigationStart"]) / 1000
             
         def get_dom_ready_time(self):
             """Get DOM ready time in seconds."""
-            navigation_start = driver.execute_script(
-                "return window.performance.timing.navigationStart"
-            )
-            dom_ready = driver.execute_script(
-                "return window.performance.timing.domContentLoadedEventEnd"
-            )
-            return (dom_ready - navigation_start) / 1000
+            timing = self.timing()
+            return (timing["domContentLoadedEventEnd"] - timing["navigationStart"]) / 1000
             
     return PerformanceMonitor()
@@ -5,10 +5,18 @@ Comprehensive test suite demonstrating framework capabilities
 
 import pytest
 import allure
+import requests
 from framework.pages.login_page import LoginPage
 from loguru import logger
 
 
+# Expected error message fragments
+_ERR_CRED = "Username and password do not match"
+_ERR_LOCKED = "locked out"
+_ERR_USER = "Username is required"
+_ERR_PASS = "Password is required"
+
+
 @allure.feature("Authentication")
 @allure.story("Login Functionality")
 class TestLogin:
@@ -32,7 +40,7 @@ class TestLogin:
         """
         # Arrange
         valid_user = test_data["valid_user"]
-        logger.info(f"Testing login with user: {valid_user['username']}")
+        logger.info("Testing login with user: {}", valid_user["username"])
         
         # Act
         with allure.step("Enter credentials and login"):
@@ -65,7 +73,7 @@ class TestLogin:
         """
         # Arrange
         invalid_user = test_data["invalid_user"]
-        logger.info(f"Testing login with invalid user: {invalid_user['username']}")
+        logger.info("Testing login with invalid user: {}", invalid_user["username"])
         
         # Act
         with allure.step("Attempt login with invalid credentials"):
@@ -79,10 +87,10 @@ class TestLogin:
             assert login_page.is_error_displayed(), "Error message should be displayed"
             
             error_message = login_page.get_error_message()
-            assert "Username and password do not match" in error_message, \
+            assert _ERR_CRED in error_message, \
                 f"Expected error about credentials mismatch, got: {error_message}"
             
-            logger.info(f"Error message verified: {error_message}")
+            logger.info("Error message verified: {}", error_message)
     
     @pytest.mark.regression
     @allure.title("Login fails with locked out user")
@@ -101,7 +109,7 @@ class TestLogin:
         """
         # Arrange
         locked_user = test_data["locked_user"]
-        logger.info(f"Testing login with locked user: {locked_user['username']}")
+        logger.info("Testing login with locked user: {}", locked_user["username"])
         
         # Act
         with allure.step("Attempt login with locked user"):
@@ -115,10 +123,10 @@ class TestLogin:
             assert login_page.is_error_displayed(), "Error message should be displayed"
             
             error_message = login_page.get_error_message()
-            assert "locked out" in error_message.lower(), \
+            assert _ERR_LOCKED in error_message.lower(), \
                 f"Expected locked out error, got: {error_message}"
             
-            logger.info(f"Locked out error verified: {error_message}")
+            logger.info("Locked out error verified: {}", error_message)
     
     @pytest.mark.regression
     @allure.title("Login fails with empty username")
@@ -147,7 +155,7 @@ class TestLogin:
             assert login_page.is_error_displayed(), "Error message should be displayed"
             
             error_message = login_page.get_error_message()
-            assert "Username is required" in error_message, \
+            assert _ERR_USER in error_message, \
                 f"Expected username required error, got: {error_message}"
             
             logger.info("Empty username error verified")
@@ -179,7 +187,7 @@ class TestLogin:
             assert login_page.is_error_displayed(), "Error message should be displayed"
             
             error_message = login_page.get_error_message()
-            assert "Password is required" in error_message, \
+            assert _ERR_PASS in error_message, \
                 f"Expected password required error, got: {error_message}"
             
             logger.info("Empty password error verified")
@@ -272,6 +280,7 @@ class TestLoginPerformance:
     """Performance tests for login functionality."""
     
     @pytest.mark.slow
+    @pytest.mark.serial
     @allure.title("Login page loads within acceptable time")
     @allure.description("Verify login page loads in under 3 seconds")
     @allure.severity(allure.severity_level.NORMAL)
@@ -285,7 +294,7 @@ class TestLoginPerformance:
         
         with allure.step("Measure page load time"):
             load_time = performance_monitor.get_page_load_time()
-            logger.info(f"Page load time: {load_time:.2f} seconds")
+            logger.info("Page load time: {:.2f} seconds", load_time)
             
             # Attach performance data to report
             allure.attach(
@@ -301,6 +310,37 @@ class TestLoginPerformance:
             logger.info("Page load performance is acceptable")
 
 
+@allure.feature("Authentication")
+@allure.story("Static Checks")
+class TestLoginStatic:
+    """Browser-free checks of the login page for fast smoke runs."""
+    
+    @pytest.mark.smoke
+    @allure.title("Login page is served")
+    @allure.description("Verify the login page responds and serves the app shell, without a browser")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_login_page_served_static(self, test_config):
+        """
+        Fetch the login page over plain HTTP.
+        
+        The login form itself is rendered client-side by React, so only the
+        served shell can be checked here; test_login_page_elements covers
+        the rendered form in a browser.
+        """
+        logger.info("Fetching login page without a browser")
+        
+        with allure.step("Fetch login page"):
+            response = requests.get(test_config.base_url, timeout=10)
+        
+        with allure.step("Verify app shell is served"):
+            assert response.status_code == 200, \
+                f"Expected HTTP 200, got {response.status_code}"
+            assert "Swag Labs" in response.text, "Page title should be present"
+            assert 'id="root"' in response.text, "App root element should be present"
+            
+            logger.info("Login page served in {:.0f} ms", response.elapsed.total_seconds() * 1000)
+
+
 # Parametrized test example
 @allure.feature("Authentication")
 @allure.story("Data-Driven Testing")
@@ -308,19 +348,21 @@ class TestLoginDataDriven:
     """Data-driven tests for login functionality."""
     
     @pytest.mark.parametrize("username,password,expected_error", [
-        ("", "", "Username is required"),
-        ("standard_user", "", "Password is required"),
-        ("invalid", "wrong", "Username and password do not match"),
-    ])
+        ("", "", _ERR_USER),
+        ("standard_user", "", _ERR_PASS),
+        ("invalid", "wrong", _ERR_CRED),
+    ], ids=["both-empty", "no-password", "bad-creds"])
     @allure.title("Data-driven login validation")
     @allure.description("Test multiple invalid login scenarios")
-    def test_invalid_login_scenarios(self, login_page, username, password, expected_error):
+    def test_invalid_login_scenarios(self, login_page_class, username, password, expected_error):
         """
         Parametrized test for multiple invalid login scenarios.
         
         Demonstrates data-driven testing capability.
+        All parameter sets share one browser; the page is reset per case.
         """
-        logger.info(f"Testing login with username='{username}', password='{password}'")
+        logger.info("Testing login with username='{}', password='{}'", username, password)
+        login_page = login_page_class.reset()
         
         # Act
         if username:
@@ -336,4 +378,4 @@ class TestLoginDataDriven:
         assert expected_error in error_message, \
             f"Expected '{expected_error}' in error, got: {error_message}"
         
-        logger.info(f"Validated error: {error_message}")
+        logger.info("Validated error: {}", error_message)
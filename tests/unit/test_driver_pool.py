@@ -0,0 +1,120 @@
+"""
+Driver Pool Tests - browser-free checks of DriverPool bookkeeping
+Drivers are stubs, so these run without Selenium browsers or a Grid
+"""
+
+import itertools
+import pytest
+from framework.core.driver_factory import DriverFactory, DriverPool
+
+
+class FakeDriver:
+    """Stand-in WebDriver recording the calls the pool makes."""
+    
+    _ids = itertools.count()
+    
+    def __init__(self, fail_reset: bool = False):
+        self.session_id = f"fake-{next(self._ids)}"
+        self.fail_reset = fail_reset
+        self.visited = []
+        self.quit_calls = 0
+    
+    def delete_all_cookies(self):
+        if self.fail_reset:
+            raise RuntimeError("browser crashed")
+    
+    def execute_script(self, script, *args):
+        return None
+    
+    def get(self, url):
+        self.visited.append(url)
+    
+    def quit(self):
+        self.quit_calls += 1
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Stub DriverFactory.create_driver; returns the list of created drivers."""
+    drivers = []
+    
+    def create_driver(factory):
+        factory.driver = FakeDriver()
+        drivers.append(factory.driver)
+        return factory.driver
+    
+    monkeypatch.setattr(DriverFactory, "create_driver", create_driver)
+    return drivers
+
+
+def test_released_driver_is_reused(created):
+    pool = DriverPool(home_url="https://example.test")
+    
+    first = pool.acquire("chrome", headless=True)
+    pool.release(first)
+    second = pool.acquire("chrome", headless=True)
+    
+    assert second is first
+    assert len(created) == 1
+    assert first.visited == ["https://example.test"]
+    assert first.quit_calls == 0
+
+
+def test_driver_beyond_max_idle_is_quit(created):
+    pool = DriverPool(max_idle=1)
+    
+    first = pool.acquire("chrome", headless=True)
+    second = pool.acquire("chrome", headless=True)
+    pool.release(first)
+    pool.release(second)
+    
+    assert first.quit_calls == 0
+    assert second.quit_calls == 1
+    assert pool.acquire("chrome", headless=True) is first
+
+
+def test_driver_failing_reset_is_discarded(created):
+    pool = DriverPool()
+    
+    broken = pool.acquire("chrome", headless=True)
+    broken.fail_reset = True
+    pool.release(broken)
+    
+    assert broken.quit_calls == 1
+    assert pool.acquire("chrome", headless=True) is not broken
+
+
+def test_quit_all_quits_idle_and_checked_out_drivers(created):
+    pool = DriverPool()
+    
+    idle = pool.acquire("chrome", headless=True)
+    busy = pool.acquire("chrome", headless=True)
+    pool.release(idle)
+    pool.quit_all()
+    
+    assert idle.quit_calls == 1
+    assert busy.quit_calls == 1
+    assert pool.acquire("chrome", headless=True) not in (idle, busy)
+
+
+def test_remote_driver_is_configured_and_quittable(monkeypatch):
+    calls = []
+    
+    class FakeRemote(FakeDriver):
+        def implicitly_wait(self, seconds):
+            calls.append(("implicitly_wait", seconds))
+        
+        def set_page_load_timeout(self, seconds):
+            pass
+        
+        def set_script_timeout(self, seconds):
+            pass
+    
+    monkeypatch.setattr(DriverFactory, "_create_remote_driver", lambda factory: FakeRemote())
+    factory = DriverFactory(headless=True, remote_url="http://grid.test:4444")
+    
+    driver = factory.create_driver()
+    factory.quit_driver()
+    
+    assert ("implicitly_wait", 0) in calls
+    assert driver.quit_calls == 1